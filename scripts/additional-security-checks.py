@@ -16,7 +16,7 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 if script_dir not in sys.path:
     sys.path.insert(0, script_dir)
 
-from security_checker import SecurityChecker
+from security_checker import DEFAULT_CACHE_FILE, SecurityChecker
 
 
 def main():
@@ -36,9 +36,14 @@ def main():
         nargs='?',
         help='Binary path (required for binary command)'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help=f'Reuse and update scan results of unchanged files in {DEFAULT_CACHE_FILE}'
+    )
 
     args = parser.parse_args()
-    checker = SecurityChecker()
+    checker = SecurityChecker(cache_file=DEFAULT_CACHE_FILE if args.cache else None)
 
     try:
         if args.command == 'build-env':
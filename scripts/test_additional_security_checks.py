@@ -4,20 +4,90 @@ test_additional_security_checks.py
 Unit tests for additional-security-checks.py
 """
 
+import json
 import unittest
 import tempfile
 import os
 import subprocess
-from unittest.mock import patch, MagicMock, mock_open
+import sys
+from contextlib import contextmanager
+from unittest.mock import patch, mock_open
 from pathlib import Path
 
 # Import the security checker classes directly from the module
-from security_checker import SecurityChecker, Colors
+from security_checker import SecurityChecker, Colors, _open_binary
+
+# Binary data with embedded strings
+_STRINGS_BIN = b'\x00\x01\x02hello\x00world\x03\x04test123\xff\xfe'
+# Data with short and long strings
+_SHORT_STRINGS_BIN = b'\x00ab\x00\x01hello\x00x\x02world123\xff'
+# Binary with test artifacts
+_ARTIFACT_BIN = b'\x00\x01NewManagerForTest\x00some other data\x02testing.T\xff'
+# Binary with a single test artifact, for tests that write their own copy
+_SINGLE_ARTIFACT_BIN = b'\x00\x01NewManagerForTest\x00production code\xff'
+# Binary without test artifacts
+_CLEAN_BIN = b'\x00\x01production code\x00regular function\x02normal data\xff'
+# Binary with Go runtime strings that should be ignored
+_RUNTIME_BIN = (
+    b'\x00\x01runtime.CallersFrames\x00'
+    b'/home/issei/go/pkg/mod/golang.org/toolchain@v0.0.1-go1.24.6.linux-arm64/src/runtime/synctest.go\x00'
+    b'synctest\x00writeString\x00WriteString\x00'
+    b'production code\x02normal data\xff'
+)
+# Binary with actual debug symbols that should be flagged
+_USER_DEBUG_BIN = (
+    b'\x00\x01testing.T\x00'
+    b'debug.Stack\x00'
+    b'TestMain\x00'
+    b'/home/user/project/test.go\x00'  # User test file, not toolchain
+    b'production code\xff'
+)
+# Binary with both runtime paths and user paths (both should be ignored for production)
+_MIXED_BIN = (
+    b'\x00\x01'
+    b'/go/pkg/mod/golang.org/toolchain@v0.0.1/src/runtime/test.go\x00'  # Should be ignored
+    b'/home/user/myproject/helper_testing.go\x00'  # Should be ignored (file path)
+    b'runtime.CallersFrames\x00'  # Runtime internal
+    b'production code\xff'
+)
+
+# Fixture files written once per test class, by name
+_BINARY_FIXTURES = {
+    'strings': _STRINGS_BIN,
+    'short_strings': _SHORT_STRINGS_BIN,
+    'empty': b'',  # Empty file (cannot be memory-mapped)
+    'artifact': _ARTIFACT_BIN,
+    'clean': _CLEAN_BIN,
+    'runtime': _RUNTIME_BIN,
+    'user_debug': _USER_DEBUG_BIN,
+    'mixed': _MIXED_BIN,
+    'executable': b'',
+}
 
 
 class TestSecurityChecker(unittest.TestCase):
     """Test cases for SecurityChecker class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the binary fixtures shared by all tests."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        tmp_dir = Path(cls._tmp.name)
+
+        # Write each fixture blob once and expose its path as cls.<name>_bin
+        for name, data in _BINARY_FIXTURES.items():
+            path = tmp_dir / name
+            path.write_bytes(data)
+            setattr(cls, f'{name}_bin', str(path))
+
+        # Executable file for the permission check
+        os.chmod(cls.executable_bin, 0o755)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared binary fixtures."""
+        cls._tmp.cleanup()
+
     def setUp(self):
         """Set up test fixtures."""
         self.checker = SecurityChecker()
@@ -35,69 +105,144 @@ class TestSecurityChecker(unittest.TestCase):
         self.checker.print_info("test info")
         self.checker.print_status(Colors.RED, "test status")
 
-    def test_run_command_success(self):
+    def test_print_methods_plain_when_not_tty(self):
+        """Test status messages drop ANSI colors when stdout is not a terminal."""
+        with patch('sys.stdout') as mock_stdout:
+            mock_stdout.isatty.return_value = False
+            checker = SecurityChecker()
+            checker.print_error("test error")
+            checker.print_status(Colors.RED, "test status")
+        written = ''.join(call.args[0] for call in mock_stdout.write.call_args_list)
+        self.assertEqual(written, "ERROR: test error\ntest status\n")
+
+        with patch('sys.stdout') as mock_stdout:
+            mock_stdout.isatty.return_value = True
+            checker = SecurityChecker()
+            checker.print_error("test error")
+        written = ''.join(call.args[0] for call in mock_stdout.write.call_args_list)
+        self.assertEqual(written, f"{Colors.RED}ERROR: test error{Colors.NC}\n")
+
+    @patch('security_checker.subprocess.run')
+    def test_run_command_success(self, mock_run):
         """Test run_command with successful command."""
+        mock_run.return_value = subprocess.CompletedProcess(['echo', 'hello'], 0, stdout='hello\n', stderr='')
+
         result = self.checker.run_command(['echo', 'hello'])
         self.assertEqual(result.returncode, 0)
         self.assertEqual(result.stdout.strip(), 'hello')
 
-    def test_run_command_failure_with_check_false(self):
+    @patch('security_checker.subprocess.run')
+    def test_run_command_failure_with_check_false(self, mock_run):
         """Test run_command with failing command and check=False."""
+        mock_run.return_value = subprocess.CompletedProcess(['false'], 1, stdout='', stderr='')
+
         result = self.checker.run_command(['false'], check=False)
         self.assertNotEqual(result.returncode, 0)
 
-    def test_run_command_failure_with_check_true(self):
+    @patch('security_checker.subprocess.run')
+    def test_run_command_discards_unwanted_output(self, mock_run):
+        """Test run_command sends streams the caller does not want to DEVNULL."""
+        mock_run.return_value = subprocess.CompletedProcess(['echo', 'hello'], 0)
+
+        self.checker.run_command(['echo', 'hello'], want_stdout=False, want_stderr=False)
+        _, kwargs = mock_run.call_args
+        self.assertEqual((kwargs['stdout'], kwargs['stderr']), (subprocess.DEVNULL, subprocess.DEVNULL))
+
+        self.checker.run_command(['echo', 'hello'], want_stderr=False, text=False)
+        _, kwargs = mock_run.call_args
+        self.assertEqual((kwargs['stdout'], kwargs['stderr']), (subprocess.PIPE, subprocess.DEVNULL))
+        self.assertFalse(kwargs['text'])
+
+        # capture_output=False inherits the streams that are not discarded
+        self.checker.run_command(['echo', 'hello'], capture_output=False, want_stderr=False)
+        _, kwargs = mock_run.call_args
+        self.assertEqual((kwargs['stdout'], kwargs['stderr']), (None, subprocess.DEVNULL))
+
+    @patch('security_checker.subprocess.run')
+    def test_run_command_failure_with_check_true(self, mock_run):
         """Test run_command with failing command and check=True raises exception."""
+        mock_run.return_value = subprocess.CompletedProcess(['false'], 1, stdout='', stderr='')
+
         with self.assertRaises(subprocess.CalledProcessError):
             self.checker.run_command(['false'], check=True)
 
+    @unittest.skipUnless(sys.executable, "Python interpreter path is unknown")
+    def test_run_command_real_process(self):
+        """Test run_command end to end with a real child process."""
+        result = self.checker.run_command([sys.executable, '-c', 'print("hello")'])
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.strip(), 'hello')
+
+        result = self.checker.run_command([sys.executable, '-c', 'print("hello")'], want_stdout=False)
+        self.assertIsNone(result.stdout)
+
     def test_extract_strings_from_binary_with_temp_file(self):
         """Test extract_strings_from_binary with a temporary binary file."""
-        # Create a temporary file with some binary data and strings
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Write some binary data with embedded strings
-            binary_data = b'\x00\x01\x02hello\x00world\x03\x04test123\xff\xfe'
-            temp_file.write(binary_data)
-            temp_file.flush()
+        strings = self.checker.extract_strings_from_binary(self.strings_bin)
 
-            try:
-                strings = self.checker.extract_strings_from_binary(temp_file.name)
+        # Check that we extracted the expected strings
+        self.assertIn('hello', strings)
+        self.assertIn('world', strings)
+        self.assertIn('test123', strings)
 
-                # Check that we extracted the expected strings
-                self.assertIn('hello', strings)
-                self.assertIn('world', strings)
-                self.assertIn('test123', strings)
-
-            finally:
-                os.unlink(temp_file.name)
+    def test_extract_strings_from_binary_bytes(self):
+        """Test extract_strings_from_binary_bytes returns undecoded strings."""
+        strings = self.checker.extract_strings_from_binary_bytes(self.strings_bin)
+        self.assertEqual(strings, [b'hello', b'world', b'test123'])
+        self.assertEqual(self.checker.extract_strings_from_binary_bytes('/nonexistent/file'), [])
 
     def test_extract_strings_from_binary_nonexistent_file(self):
         """Test extract_strings_from_binary with non-existent file."""
         strings = self.checker.extract_strings_from_binary('/nonexistent/file')
         self.assertEqual(strings, [])
 
-    def test_extract_strings_from_binary_min_length(self):
-        """Test extract_strings_from_binary respects minimum length."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Write data with short and long strings
-            binary_data = b'\x00ab\x00\x01hello\x00x\x02world123\xff'
-            temp_file.write(binary_data)
-            temp_file.flush()
+    def test_extract_strings_from_binary_empty_file(self):
+        """Test extract_strings_from_binary with an empty file (cannot be memory-mapped)."""
+        strings = self.checker.extract_strings_from_binary(self.empty_bin)
+        self.assertEqual(strings, [])
 
-            try:
-                # Test with default min_length (4)
-                strings = self.checker.extract_strings_from_binary(temp_file.name)
-                self.assertIn('hello', strings)
-                self.assertIn('world123', strings)
-                self.assertNotIn('ab', strings)  # Too short
-                self.assertNotIn('x', strings)   # Too short
+    @unittest.skipUnless(getattr(os, 'O_NOATIME', 0), "O_NOATIME is not supported on this platform")
+    def test_open_binary_read_fallback_does_not_chain_errors(self):
+        """Test that errors raised while using the read fallback are not chained to the mmap failure."""
+        with self.assertRaises(KeyError) as ctx:
+            with _open_binary(self.empty_bin) as data:
+                self.assertEqual(data, b'')
+                raise KeyError('caller error')
+        self.assertIsNone(ctx.exception.__context__)
+
+    def test_extract_strings_from_binary_noatime_refused(self):
+        """Test extraction falls back to a plain open when O_NOATIME is refused."""
+        real_open = os.open
+
+        def fake_open(path, flags, *args):
+            if flags & os.O_NOATIME:
+                raise PermissionError(1, 'Operation not permitted')
+            return real_open(path, flags, *args)
+
+        with patch('security_checker.os.open', side_effect=fake_open):
+            strings = self.checker.extract_strings_from_binary(self.strings_bin)
+        self.assertEqual(strings, ['hello', 'world', 'test123'])
+
+    @unittest.skipUnless(os.path.isdir('/proc/self/fd'), "open file descriptors cannot be listed")
+    def test_extract_strings_from_binary_directory_does_not_leak_fds(self):
+        """Test that extracting from a directory closes every descriptor it opened."""
+        fds_before = len(os.listdir('/proc/self/fd'))
+        for _ in range(5):
+            self.assertEqual(self.checker.extract_strings_from_binary(self._tmp.name), [])
+        self.assertEqual(len(os.listdir('/proc/self/fd')), fds_before)
 
-                # Test with min_length of 2
-                strings_short = self.checker.extract_strings_from_binary(temp_file.name, min_length=2)
-                self.assertIn('ab', strings_short)
+    def test_extract_strings_from_binary_min_length(self):
+        """Test extract_strings_from_binary respects minimum length."""
+        # Test with default min_length (4)
+        strings = self.checker.extract_strings_from_binary(self.short_strings_bin)
+        self.assertIn('hello', strings)
+        self.assertIn('world123', strings)
+        self.assertNotIn('ab', strings)  # Too short
+        self.assertNotIn('x', strings)   # Too short
 
-            finally:
-                os.unlink(temp_file.name)
+        # Test with min_length of 2
+        strings_short = self.checker.extract_strings_from_binary(self.short_strings_bin, min_length=2)
+        self.assertIn('ab', strings_short)
 
     def test_check_binary_security_file_not_found(self):
         """Test check_binary_security with non-existent file."""
@@ -106,119 +251,203 @@ class TestSecurityChecker(unittest.TestCase):
 
     def test_check_binary_security_with_test_artifacts(self):
         """Test check_binary_security detects test artifacts."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Create binary with test artifacts
-            binary_data = b'\x00\x01NewManagerForTest\x00some other data\x02testing.T\xff'
-            temp_file.write(binary_data)
-            temp_file.flush()
-
-            try:
-                result = self.checker.check_binary_security(temp_file.name)
-                self.assertFalse(result)  # Should fail because test artifacts found
-
-            finally:
-                os.unlink(temp_file.name)
+        result = self.checker.check_binary_security(self.artifact_bin)
+        self.assertFalse(result)  # Should fail because test artifacts found
 
     def test_check_binary_security_clean_binary(self):
         """Test check_binary_security with clean binary."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Create binary without test artifacts
-            binary_data = b'\x00\x01production code\x00regular function\x02normal data\xff'
-            temp_file.write(binary_data)
-            temp_file.flush()
-
-            try:
-                result = self.checker.check_binary_security(temp_file.name)
-                self.assertTrue(result)  # Should pass because no test artifacts
-
-            finally:
-                os.unlink(temp_file.name)
+        result = self.checker.check_binary_security(self.clean_bin)
+        self.assertTrue(result)  # Should pass because no test artifacts
 
     def test_check_binary_security_go_runtime_internals_ignored(self):
         """Test that Go runtime internals are not flagged as debug symbols."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Create binary with Go runtime strings that should be ignored
-            binary_data = (
-                b'\x00\x01runtime.CallersFrames\x00'
-                b'/home/issei/go/pkg/mod/golang.org/toolchain@v0.0.1-go1.24.6.linux-arm64/src/runtime/synctest.go\x00'
-                b'synctest\x00writeString\x00WriteString\x00'
-                b'production code\x02normal data\xff'
-            )
-            temp_file.write(binary_data)
-            temp_file.flush()
-
-            try:
-                result = self.checker.check_binary_security(temp_file.name)
-                self.assertTrue(result)  # Should pass because these are Go runtime internals
-
-            finally:
-                os.unlink(temp_file.name)
+        result = self.checker.check_binary_security(self.runtime_bin)
+        self.assertTrue(result)  # Should pass because these are Go runtime internals
 
     def test_check_binary_security_user_debug_symbols_detected(self):
         """Test that user debug symbols are properly detected."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Create binary with actual debug symbols that should be flagged
-            binary_data = (
-                b'\x00\x01testing.T\x00'
-                b'debug.Stack\x00'
-                b'TestMain\x00'
-                b'/home/user/project/test.go\x00'  # User test file, not toolchain
-                b'production code\xff'
-            )
-            temp_file.write(binary_data)
-            temp_file.flush()
+        result = self.checker.check_binary_security(self.user_debug_bin)
+        self.assertFalse(result)  # Should fail because user debug symbols found
 
+    def test_check_binary_security_mixed_runtime_and_user_paths(self):
+        """Test binary with mix of runtime and user paths - file paths should be ignored in production."""
+        result = self.checker.check_binary_security(self.mixed_bin)
+        self.assertTrue(result)  # Should pass - file paths are ignored for production binaries
+
+    def test_prescan_binaries(self):
+        """Test that binaries are scanned in parallel and the results reused."""
+        self.checker._prescan_binaries([self.artifact_bin, self.clean_bin])
+        self.assertEqual(self.checker._binary_scans[self.artifact_bin][1], ['NewManagerForTest', 'testing.T'])
+        self.assertEqual(self.checker._binary_scans[self.clean_bin][1], [])
+
+        with patch('security_checker._scan_binary') as mock_scan_binary:
+            self.assertFalse(self.checker.check_binary_security(self.artifact_bin))
+            self.assertTrue(self.checker.check_binary_security(self.clean_bin))
+            mock_scan_binary.assert_not_called()
+
+    def test_check_binary_security_reuses_cache(self):
+        """Test that an unchanged binary is not rescanned when a cache file is configured."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            binary = Path(temp_dir, 'artifact')
+            binary.write_bytes(_SINGLE_ARTIFACT_BIN)
+            cache_file = str(Path(temp_dir, 'cache.json'))
+
+            self.assertFalse(SecurityChecker(cache_file=cache_file).check_binary_security(str(binary)))
+
+            with patch('security_checker._scan_binary') as mock_scan_binary:
+                self.assertFalse(SecurityChecker(cache_file=cache_file).check_binary_security(str(binary)))
+                mock_scan_binary.assert_not_called()
+
+    def test_save_cache_leaves_no_temporary_file(self):
+        """Test that saving the cache replaces the file and removes its temporary copy."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checker = SecurityChecker(cache_file=str(Path(temp_dir, 'cache.json')))
+            self.assertFalse(checker.check_binary_security(self.artifact_bin))
+            self.assertEqual(os.listdir(temp_dir), ['cache.json'])
+
+            with patch('security_checker.os.replace', side_effect=OSError("read-only")), \
+                    patch.object(SecurityChecker, 'print_warning') as mock_print_warning:
+                checker._save_cache()
+            mock_print_warning.assert_called_once()
+            self.assertEqual(os.listdir(temp_dir), ['cache.json'])
+
+    def test_prescan_binaries_saves_cache_once(self):
+        """Test that prescanning a batch of binaries writes the cache file once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checker = SecurityChecker(cache_file=str(Path(temp_dir, 'cache.json')))
+            with patch.object(SecurityChecker, '_save_cache', autospec=True) as mock_save_cache:
+                checker._prescan_binaries([self.artifact_bin, self.clean_bin, self.mixed_bin])
+            mock_save_cache.assert_called_once_with(checker)
+            self.assertEqual(set(checker._cache['binaries']),
+                             {self.artifact_bin, self.clean_bin, self.mixed_bin})
+
+    def test_check_binary_security_remembers_scan(self):
+        """Test that an unchanged binary is scanned only once per checker."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            binary = Path(temp_dir, 'artifact')
+            binary.write_bytes(_SINGLE_ARTIFACT_BIN)
+
+            self.assertFalse(self.checker.check_binary_security(str(binary)))
+            with patch('security_checker._scan_binary') as mock_scan_binary:
+                self.assertFalse(self.checker.check_binary_security(str(binary)))
+                mock_scan_binary.assert_not_called()
+
+            # A modified binary is rescanned
+            binary.write_bytes(b'\x00\x01production code\x00normal data\xff\xff')
+            self.assertTrue(self.checker.check_binary_security(str(binary)))
+
+    @contextmanager
+    def _in_module_dir(self):
+        """Run the block inside a temporary directory holding a subdir with no go.mod.
+
+        Yields (go.mod path of the temporary directory, the subdirectory); the
+        working directory is the temporary directory itself.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            go_mod = Path(temp_dir, 'go.mod').resolve()
+            go_mod.write_text('module example.com/m\n')
+            sub_dir = Path(temp_dir, 'sub')
+            sub_dir.mkdir()
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
             try:
-                result = self.checker.check_binary_security(temp_file.name)
-                self.assertFalse(result)  # Should fail because user debug symbols found
-
+                yield go_mod, sub_dir
             finally:
-                os.unlink(temp_file.name)
+                os.chdir(cwd)
 
-    def test_check_binary_security_mixed_runtime_and_user_paths(self):
-        """Test binary with mix of runtime and user paths - file paths should be ignored in production."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Create binary with both runtime paths and user paths (both should be ignored for production)
-            binary_data = (
-                b'\x00\x01'
-                b'/go/pkg/mod/golang.org/toolchain@v0.0.1/src/runtime/test.go\x00'  # Should be ignored
-                b'/home/user/myproject/helper_testing.go\x00'  # Should be ignored (file path)
-                b'runtime.CallersFrames\x00'  # Runtime internal
-                b'production code\xff'
-            )
-            temp_file.write(binary_data)
-            temp_file.flush()
+    @staticmethod
+    def _go_env_result(go_mod):
+        """Return a CompletedProcess as printed by go env -json GOVERSION GOMOD."""
+        stdout = json.dumps({'GOVERSION': 'go1.21.0', 'GOMOD': str(go_mod)})
+        return subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
 
-            try:
-                result = self.checker.check_binary_security(temp_file.name)
-                self.assertTrue(result)  # Should pass - file paths are ignored for production binaries
+    # The go invocations check_build_environment starts side by side
+    _GO_ENV_CMD = ['go', 'env', '-json', 'GOVERSION', 'GOMOD']
+    _GO_MOD_VERIFY_CMD = ['go', 'mod', 'verify']
 
-            finally:
-                os.unlink(temp_file.name)
+    def assert_build_env_commands_started(self, mock_run_command):
+        """Assert that both go env and go mod verify were started, once each."""
+        started = sorted(call.args[0] for call in mock_run_command.call_args_list)
+        self.assertEqual(started, sorted([self._GO_ENV_CMD, self._GO_MOD_VERIFY_CMD]))
 
     @patch.object(SecurityChecker, 'run_command')
     def test_check_build_environment_go_not_found(self, mock_run_command):
         """Test check_build_environment when go command fails."""
-        mock_run_command.side_effect = subprocess.CalledProcessError(1, ['go', 'version'])
+        mock_run_command.side_effect = subprocess.CalledProcessError(1, ['go'])
 
-        result = self.checker.check_build_environment()
+        with self._in_module_dir(), patch.object(SecurityChecker, 'print_error') as mock_print_error:
+            result = self.checker.check_build_environment()
         self.assertFalse(result)
 
-    @patch('pathlib.Path.is_file')
+        # Both commands were started concurrently, but only the go env failure is reported
+        self.assert_build_env_commands_started(mock_run_command)
+        mock_print_error.assert_called_once_with("Go is not installed or not in PATH")
+
     @patch.object(SecurityChecker, 'run_command')
-    def test_check_build_environment_no_go_mod(self, mock_run_command, mock_is_file):
+    def test_check_build_environment_no_go_mod(self, mock_run_command):
         """Test check_build_environment when go.mod is missing."""
-        # Mock successful go version
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.stdout = "go version go1.21.0 linux/amd64"
-        mock_run_command.return_value = mock_process
+        # Mock successful go env outside a module
+        mock_run_command.return_value = self._go_env_result(os.devnull)
+
+        with self._in_module_dir() as (_, sub_dir):
+            os.chdir(sub_dir)
+            result = self.checker.check_build_environment()
+        self.assertFalse(result)
 
-        # Mock go.mod not found
-        mock_is_file.return_value = False
+        # go is not started without a local go.mod
+        mock_run_command.assert_not_called()
 
-        result = self.checker.check_build_environment()
+    @patch.object(SecurityChecker, 'run_command')
+    def test_check_build_environment_go_mod_in_parent_dir(self, mock_run_command):
+        """Test check_build_environment requires go.mod in the working directory."""
+        with self._in_module_dir() as (go_mod, sub_dir):
+            # go env resolves the parent's go.mod, but the working directory has none
+            os.chdir(sub_dir)
+            mock_run_command.return_value = self._go_env_result(go_mod)
+
+            result = self.checker.check_build_environment()
         self.assertFalse(result)
+        mock_run_command.assert_not_called()
+
+    @patch.object(SecurityChecker, 'run_command')
+    def test_check_build_environment_gomod_elsewhere(self, mock_run_command):
+        """Test check_build_environment rejects a GOMOD other than the local go.mod."""
+        with self._in_module_dir() as (go_mod, sub_dir):
+            # The working directory has its own go.mod, but go resolved the parent's
+            Path(sub_dir, 'go.mod').write_text('module example.com/m/sub\n')
+            os.chdir(sub_dir)
+            mock_run_command.return_value = self._go_env_result(go_mod)
+
+            with patch.object(SecurityChecker, 'print_error') as mock_print_error:
+                result = self.checker.check_build_environment()
+        self.assertFalse(result)
+        self.assert_build_env_commands_started(mock_run_command)
+        mock_print_error.assert_called_once_with("go.mod file not found")
+
+    @patch.object(SecurityChecker, 'run_command')
+    def test_check_build_environment_mod_verify_failed(self, mock_run_command):
+        """Test check_build_environment when go mod verify fails."""
+        with self._in_module_dir() as (go_mod, _):
+            def run_command(cmd, *args, **kwargs):
+                if cmd == ['go', 'mod', 'verify']:
+                    raise subprocess.CalledProcessError(1, cmd)
+                return self._go_env_result(go_mod)
+            mock_run_command.side_effect = run_command
+
+            result = self.checker.check_build_environment()
+        self.assertFalse(result)
+        self.assert_build_env_commands_started(mock_run_command)
+
+    @patch.object(SecurityChecker, 'run_command')
+    def test_check_build_environment_runs_once(self, mock_run_command):
+        """Test check_build_environment reuses its result on later calls."""
+        with self._in_module_dir() as (go_mod, _):
+            mock_run_command.return_value = self._go_env_result(go_mod)
+
+            self.assertTrue(self.checker.check_build_environment())
+            self.assertTrue(self.checker.check_build_environment())
+        # The second call reuses the result without starting go again
+        self.assert_build_env_commands_started(mock_run_command)
 
     def test_check_binary_permissions_file_not_found(self):
         """Test check_binary_permissions with non-existent file."""
@@ -227,51 +456,131 @@ class TestSecurityChecker(unittest.TestCase):
 
     def test_check_binary_permissions_with_temp_file(self):
         """Test check_binary_permissions with actual file."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            try:
-                # Make file executable
-                os.chmod(temp_file.name, 0o755)
-
-                result = self.checker.check_binary_permissions(temp_file.name)
-                self.assertTrue(result)
-
-            finally:
-                os.unlink(temp_file.name)
+        result = self.checker.check_binary_permissions(self.executable_bin)
+        self.assertTrue(result)
 
-    @patch('pathlib.Path.rglob')
-    def test_check_build_tags_clean_file(self, mock_rglob):
+    @patch.object(SecurityChecker, '_iter_go_files')
+    def test_check_build_tags_clean_file(self, mock_iter_go_files):
         """Test check_build_tags with files that don't need test tags."""
-        # Mock Path.rglob to return a regular go file
-        mock_file = MagicMock()
-        mock_file.name = 'main.go'
-        mock_file.parts = ('src', 'main.go')
-        mock_rglob.return_value = [mock_file]
+        # Return a regular go file from the source tree walk
+        mock_iter_go_files.return_value = [Path('src/main.go')]
 
         result = self.checker.check_build_tags()
         self.assertTrue(result)
 
-    @patch('builtins.open', mock_open(read_data='package main\n\nfunc NewManagerForTest() {}'))
-    @patch('pathlib.Path.rglob')
-    def test_check_build_tags_missing_constraint(self, mock_rglob):
+    @patch('builtins.open', mock_open(read_data=b'package main\n\nfunc NewManagerForTest() {}'))
+    @patch.object(SecurityChecker, '_iter_go_files')
+    def test_check_build_tags_missing_constraint(self, mock_iter_go_files):
         """Test check_build_tags with testing file missing build constraint."""
-        # Mock Path.rglob to return a testing go file
-        mock_file = MagicMock()
-        mock_file.name = 'manager_testing.go'
-        mock_file.parts = ('src', 'manager_testing.go')
-        mock_rglob.return_value = [mock_file]
+        # Return a testing go file from the source tree walk
+        mock_iter_go_files.return_value = [Path('src/manager_testing.go')]
 
         result = self.checker.check_build_tags()
         self.assertFalse(result)
 
-    @patch('pathlib.Path.rglob')
-    def test_check_forbidden_patterns_clean_code(self, mock_rglob):
+    def test_check_build_tags_constraint_before_package(self):
+        """Test check_build_tags only honors the constraint before the package clause."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tagged = Path(temp_dir, 'tagged_testing.go')
+            tagged.write_bytes(b'// Copyright\n  //go:build test\n\npackage main\n')
+            late_tag = Path(temp_dir, 'late_testing.go')
+            late_tag.write_bytes(b'// mentions //go:build test\npackage main\n\n//go:build test\n')
+            long_header = Path(temp_dir, 'long_header_testing.go')
+            long_header.write_bytes(b'// comment\n' * 1000 + b'//go:build test\n\npackage main\n')
+
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[tagged, long_header]):
+                self.assertTrue(SecurityChecker().check_build_tags())
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[late_tag]):
+                self.assertFalse(SecurityChecker().check_build_tags())
+
+    @patch.object(SecurityChecker, '_iter_go_files')
+    def test_check_forbidden_patterns_clean_code(self, mock_iter_go_files):
         """Test check_forbidden_patterns with clean code."""
-        # Mock Path.rglob to return empty list
-        mock_rglob.return_value = []
+        # Return no go files from the source tree walk
+        mock_iter_go_files.return_value = []
 
         result = self.checker.check_forbidden_patterns()
         self.assertTrue(result)
 
+    def test_check_forbidden_patterns_detects_non_utf8_file(self):
+        """Test check_forbidden_patterns searches raw bytes, including non-UTF-8 files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            go_file = Path(temp_dir, 'main.go')
+            go_file.write_bytes(b'package main\n// \xff\xfe\nvar m = newManagerInternal()\n')
+
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[go_file]):
+                result = self.checker.check_forbidden_patterns()
+            self.assertFalse(result)
+
+    def test_check_forbidden_patterns_allowed_locations(self):
+        """Test that patterns are ignored where they are allowed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = Path(temp_dir, 'manager_test.go')
+            test_file.write_bytes(b'package main\nvar m = newManagerInternal()\n')
+            hash_flag_test_file = Path(temp_dir, 'flag_test.go')
+            hash_flag_test_file.write_bytes(b'package main\nvar f = "--hash-directory"\n')
+
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[test_file]):
+                self.assertTrue(SecurityChecker().check_forbidden_patterns())
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[hash_flag_test_file]):
+                self.assertFalse(SecurityChecker().check_forbidden_patterns())
+
+    def test_check_forbidden_patterns_reuses_cache(self):
+        """Test that unchanged files are not re-read when a cache file is configured."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            go_file = Path(temp_dir, 'main.go')
+            go_file.write_bytes(b'package main\nvar m = newManagerInternal()\n')
+            cache_file = str(Path(temp_dir, 'cache.json'))
+
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[go_file]):
+                self.assertFalse(SecurityChecker(cache_file=cache_file).check_forbidden_patterns())
+
+                # The cached result is reused without reading the file again
+                with patch('security_checker._read_file') as mock_read_file:
+                    self.assertFalse(SecurityChecker(cache_file=cache_file).check_forbidden_patterns())
+                    mock_read_file.assert_not_called()
+
+                # A modified file is rescanned
+                go_file.write_bytes(b'package main\n')
+                self.assertTrue(SecurityChecker(cache_file=cache_file).check_forbidden_patterns())
+
+    def test_check_forbidden_patterns_discards_cache_of_other_rules(self):
+        """Test that a cache written under different scan rules is not trusted."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            go_file = Path(temp_dir, 'main.go')
+            go_file.write_bytes(b'package main\nvar m = newManagerInternal()\n')
+            cache_file = str(Path(temp_dir, 'cache.json'))
+
+            with patch.object(SecurityChecker, '_iter_go_files', return_value=[go_file]):
+                with patch('security_checker._cache_fingerprint', return_value='other rules'):
+                    # A stale verdict recorded while the file was considered clean
+                    with patch('security_checker._find_source_patterns', return_value=[]):
+                        self.assertTrue(SecurityChecker(cache_file=cache_file).check_forbidden_patterns())
+                self.assertFalse(SecurityChecker(cache_file=cache_file).check_forbidden_patterns())
+
+    def test_get_go_files_skips_vendor_dirs(self):
+        """Test that the source tree walk skips vendor-like directories and is cached."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            Path(temp_dir, 'pkg').mkdir()
+            Path(temp_dir, 'pkg', 'main.go').write_text('package main\n')
+            Path(temp_dir, 'pkg', 'README.md').write_text('docs\n')
+            Path(temp_dir, 'vendor', 'dep').mkdir(parents=True)
+            Path(temp_dir, 'vendor', 'dep', 'dep.go').write_text('package dep\n')
+            Path(temp_dir, 'node_modules', 'pkg').mkdir(parents=True)
+            Path(temp_dir, 'node_modules', 'pkg', 'gen.go').write_text('package pkg\n')
+
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                go_files = self.checker._get_go_files()
+                self.assertEqual(go_files, [Path('pkg/main.go')])
+
+                # A later call reuses the cached walk result
+                Path('pkg', 'other.go').write_text('package main\n')
+                self.assertIs(self.checker._get_go_files(), go_files)
+            finally:
+                os.chdir(cwd)
+
 
 class TestColors(unittest.TestCase):
     """Test cases for Colors class."""